@@ -0,0 +1,40 @@
+"""Per-invocation clock shared by models and services."""
+
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+
+def start_request_clock() -> Token[datetime | None]:
+    """
+    Capture the current UTC time for the invocation being handled.
+
+    Every timestamp produced through utc_now() until the clock is reset
+    shares this value.
+
+    Returns:
+        Token: Token to pass to reset_request_clock when the invocation ends
+    """
+    return _request_now.set(datetime.now(UTC))
+
+
+def reset_request_clock(token: Token[datetime | None]) -> None:
+    """
+    Clear the invocation timestamp set by start_request_clock.
+
+    Args:
+        token: Token returned by start_request_clock
+    """
+    _request_now.reset(token)
+
+
+def utc_now() -> datetime:
+    """
+    Get the current UTC time.
+
+    Returns:
+        datetime: Invocation timestamp when one is set, otherwise the wall clock
+    """
+    now = _request_now.get()
+    return now if now is not None else datetime.now(UTC)
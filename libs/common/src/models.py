@@ -5,6 +5,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from libs.common.src.clock import utc_now
+
 
 class APIResponse(BaseModel):
     """Standard API response model."""
@@ -17,7 +19,7 @@ class APIResponse(BaseModel):
         default=None, description="Response payload data"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=utc_now, description="Response timestamp"
     )
 
 
@@ -31,6 +33,4 @@ class ErrorResponse(BaseModel):
     details: dict[str, Any] | None = Field(
         default=None, description="Additional error details"
     )
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Error timestamp"
-    )
+    timestamp: datetime = Field(default_factory=utc_now, description="Error timestamp")
@@ -1,12 +1,15 @@
 """Lambda handler for IDP API."""
 
-import json
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from libs.common.src.clock import reset_request_clock, start_request_clock
 from libs.common.src.exceptions import PSNEmulatorException, ValidationException
 from libs.common.src.logger import get_logger
-from libs.common.src.models import ErrorResponse
 from pydantic import ValidationError
 
 # Try absolute imports first (for Docker), then relative imports (for local testing)
@@ -19,6 +22,47 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+}
+
+# Pre-built 404 envelope; the message is JSON-encoded so odd paths stay valid
+_NOT_FOUND_TMPL = '{"error":"NOT_FOUND","message":%s}'
+
+# Bodies of fixed 400 responses, encoded once at import
+_MISSING_AUTH_HEADER_BODY = orjson.dumps(
+    {
+        "error": "VALIDATION_ERROR",
+        "message": "Invalid or missing Authorization header",
+    }
+).decode()
+_MISSING_REFRESH_TOKEN_BODY = orjson.dumps(
+    {"error": "VALIDATION_ERROR", "message": "refresh_token is required"}
+).decode()
+
+# Shared empty mapping for a missing body; treat as read-only
+_EMPTY: dict[str, Any] = {}
+
+# Reused across warm invocations; also holds the issued tokens, so it must
+# outlive a single request
+_SERVICE = IDPService()
+
+_TOKEN_PATH = "/auth/token"
+_USERINFO_PATH = "/auth/userinfo"
+_REFRESH_PATH = "/auth/refresh"
+
+# Fallback matcher for stage-prefixed paths like /prod/auth/token
+_PATH_RE = re.compile(r"/auth/(?:token|userinfo|refresh)$")
+
+# Route table keyed by (HTTP method, path). Every route is called with
+# (event, body).
+_ROUTES: dict[tuple[str, str], Callable[[dict[str, Any], Any], dict[str, Any]]] = {
+    ("POST", _TOKEN_PATH): lambda _event, body: handle_authentication(body),
+    ("GET", _USERINFO_PATH): lambda event, _body: handle_userinfo(event),
+    ("POST", _REFRESH_PATH): lambda _event, body: handle_token_refresh(body),
+}
+
 
 def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str, Any]:
     """
@@ -40,24 +84,27 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
     """
     logger.info("IDP API request received", extra={"path": event.get("path")})
 
+    clock_token = start_request_clock()
     try:
         # Parse request body
-        body_str = event.get("body", "{}") or "{}"
-        body = json.loads(body_str)
+        raw_body = event.get("body")
+        body = orjson.loads(raw_body) if raw_body else _EMPTY
         http_method = event.get("httpMethod", "")
         path = event.get("path", "")
 
-        # Route to appropriate handler
-        if http_method == "POST" and path.endswith("/auth/token"):
-            return handle_authentication(body)
-        elif http_method == "GET" and path.endswith("/auth/userinfo"):
-            return handle_userinfo(event)
-        elif http_method == "POST" and path.endswith("/auth/refresh"):
-            return handle_token_refresh(body)
-        else:
-            return create_error_response(
-                404, "NOT_FOUND", f"Endpoint not found: {http_method} {path}"
-            )
+        # Exact paths hit the table directly; anything else is normalised once
+        route = _ROUTES.get((http_method, path)) or _ROUTES.get(
+            (http_method, _match_path(path))
+        )
+        if route is None:
+            return {
+                "statusCode": 404,
+                "headers": {**_JSON_HEADERS},
+                "body": _NOT_FOUND_TMPL
+                % orjson.dumps(f"Endpoint not found: {http_method} {path}").decode(),
+            }
+
+        return route(event, body)
 
     except ValidationException as e:
         logger.warning("Validation error", extra={"error": str(e)})
@@ -73,13 +120,34 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
             500, "INTERNAL_ERROR", "An unexpected error occurred"
         )
 
+    finally:
+        reset_request_clock(clock_token)
+
 
-def handle_authentication(body: dict[str, Any]) -> dict[str, Any]:
+@lru_cache(maxsize=256)
+def _match_path(path: str) -> str:
+    """
+    Map a request path to its route path.
+
+    Args:
+        path: Raw request path, possibly with a stage prefix
+
+    Returns:
+        str: Matching route path, or an empty string if none matches
+    """
+    match = _PATH_RE.search(path)
+    return match.group(0) if match else ""
+
+
+def handle_authentication(
+    body: dict[str, Any], service: IDPService | None = None
+) -> dict[str, Any]:
     """
     Handle user authentication request.
 
     Args:
         body: Request body containing authentication credentials
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with authentication token
@@ -89,7 +157,7 @@ def handle_authentication(body: dict[str, Any]) -> dict[str, Any]:
         auth_request = AuthenticationRequest(**body)
 
         # Process authentication
-        service = IDPService()
+        service = service or _SERVICE
         token_response = service.authenticate(
             auth_request.username, auth_request.password
         )
@@ -100,12 +168,15 @@ def handle_authentication(body: dict[str, Any]) -> dict[str, Any]:
         raise ValidationException(str(e)) from e
 
 
-def handle_userinfo(event: dict[str, Any]) -> dict[str, Any]:
+def handle_userinfo(
+    event: dict[str, Any], service: IDPService | None = None
+) -> dict[str, Any]:
     """
     Handle user info request.
 
     Args:
         event: Lambda event with authorization header
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with user information
@@ -115,32 +186,41 @@ def handle_userinfo(event: dict[str, Any]) -> dict[str, Any]:
     auth_header = headers.get("Authorization", "")
 
     if not auth_header.startswith("Bearer "):
-        raise ValidationException("Invalid or missing Authorization header")
+        return {
+            "statusCode": 400,
+            "headers": {**_JSON_HEADERS},
+            "body": _MISSING_AUTH_HEADER_BODY,
+        }
 
     token = auth_header.replace("Bearer ", "")
 
     # Get user info
-    service = IDPService()
-    user_info = service.get_user_info(token)
+    service = service or _SERVICE
+    return create_success_response(200, service.get_user_info_json(token))
 
-    return create_success_response(200, user_info.model_dump_json())
 
-
-def handle_token_refresh(body: dict[str, Any]) -> dict[str, Any]:
+def handle_token_refresh(
+    body: dict[str, Any], service: IDPService | None = None
+) -> dict[str, Any]:
     """
     Handle token refresh request.
 
     Args:
         body: Request body containing refresh token
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with new access token
     """
     refresh_token = body.get("refresh_token")
     if not refresh_token:
-        raise ValidationException("refresh_token is required")
+        return {
+            "statusCode": 400,
+            "headers": {**_JSON_HEADERS},
+            "body": _MISSING_REFRESH_TOKEN_BODY,
+        }
 
-    service = IDPService()
+    service = service or _SERVICE
     token_response = service.refresh_token(refresh_token)
 
     return create_success_response(200, token_response.model_dump_json())
@@ -159,13 +239,11 @@ def create_success_response(
     Returns:
         dict: Formatted API Gateway response
     """
-    body = data if isinstance(data, str) else json.dumps(data)
+    # orjson emits UTF-8 bytes (non-ASCII is not escaped), so decode once here
+    body = data if isinstance(data, str) else orjson.dumps(data).decode()
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-        },
+        "headers": {**_JSON_HEADERS},
         "body": body,
     }
 
@@ -184,13 +262,10 @@ def create_error_response(
     Returns:
         dict: Formatted API Gateway error response
     """
-    error_response = ErrorResponse(error=error_type, message=message)
-
+    # The envelope shape is fixed, so encode it directly rather than building
+    # and validating an ErrorResponse model for an outgoing payload
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-        },
-        "body": error_response.model_dump_json(),
+        "headers": {**_JSON_HEADERS},
+        "body": orjson.dumps({"error": error_type, "message": message}).decode(),
     }
@@ -2,7 +2,12 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from libs.common.src.clock import utc_now
+from pydantic import BaseModel, ConfigDict, Field
+
+# Basic email shape check, run by pydantic-core's regex engine. Replaces
+# EmailStr so the email-validator package is neither imported nor run
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
 
 class AuthenticationRequest(BaseModel):
@@ -16,7 +21,9 @@ class AuthenticationRequest(BaseModel):
 class TokenResponse(BaseModel):
     """Response model for authentication token."""
 
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+    model_config = ConfigDict(
+        frozen=True, json_encoders={datetime: lambda v: v.isoformat()}
+    )
 
     access_token: str = Field(description="JWT access token")
     token_type: str = Field(default="Bearer", description="Token type")
@@ -25,7 +32,7 @@ class TokenResponse(BaseModel):
         default=None, description="Refresh token if applicable"
     )
     issued_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Token issuance timestamp"
+        default_factory=utc_now, description="Token issuance timestamp"
     )
 
 
@@ -36,10 +43,10 @@ class UserInfo(BaseModel):
 
     user_id: str = Field(description="Unique user identifier")
     username: str = Field(description="Username")
-    email: EmailStr = Field(description="User email address")
+    email: str = Field(pattern=EMAIL_PATTERN, description="User email address")
     is_active: bool = Field(default=True, description="User active status")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Account creation timestamp"
+        default_factory=utc_now, description="Account creation timestamp"
     )
 
 
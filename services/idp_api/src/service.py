@@ -1,8 +1,13 @@
 """Business logic for IDP API."""
 
+import base64
+import hashlib
+import hmac
 import secrets
 import time
-from datetime import datetime
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
 from libs.common.src.exceptions import AuthenticationException, NotFoundException
@@ -16,28 +21,73 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Entropy per token (matches secrets.token_urlsafe(32)) and tokens per refill
+_TOKEN_BYTES = 32
+_TOKEN_POOL_SIZE = 64
+
+# Most recent successful logins kept for reuse by repeated identical requests
+_AUTH_CACHE_SIZE = 512
+
+
+# Demo users copied into each IDPService instance
+_SEED_USERS: dict[str, dict[str, Any]] = {
+    "testuser": {
+        "user_id": "usr_001",
+        "username": "testuser",
+        # Digest precomputed once at import; this is a demo password
+        "password_hash": hashlib.sha256(b"password123").digest(),
+        "email": "testuser@example.com",
+        "is_active": True,
+        # Stored as an epoch timestamp; converted to datetime only for responses
+        "created_at_ts": time.time(),
+    }
+}
+
+
+@dataclass(slots=True)
+class TokenRecord:
+    """Stored metadata for an issued access or refresh token."""
+
+    user_id: str
+    username: str
+    expires_at: int
+
 
 class IDPService:
     """Service class for Identity Provider operations."""
 
-    # In-memory storage for demo purposes - replace with DynamoDB in production
-    _users: dict[str, dict[str, Any]] = {
-        "testuser": {
-            "user_id": "usr_001",
-            "username": "testuser",
-            "password": "password123",  # noqa: S105 - This is a demo password
-            "email": "testuser@example.com",
-            "is_active": True,
-            "created_at": datetime.utcnow(),
+    # Pre-generated tokens, refilled in batches by _generate_token
+    _token_pool: list[str] = []
+
+    def __init__(self) -> None:
+        # Per-instance in-memory storage for demo purposes; the handler keeps
+        # one long-lived instance. Replace with DynamoDB in production
+        self._users: dict[str, dict[str, Any]] = {
+            username: dict(user) for username, user in _SEED_USERS.items()
         }
-    }
 
-    _tokens: dict[str, dict[str, str]] = {}
+        # Access and refresh tokens are kept apart so a token's type is implied
+        # by where it is stored
+        self._access_tokens: dict[str, TokenRecord] = {}
+        self._refresh_tokens: dict[str, TokenRecord] = {}
+
+        # Serialized UserInfo bodies keyed by username; valid only while user
+        # records are unchanged (see get_user_info_json)
+        self._user_info_json: dict[str, str] = {}
+
+        # (username, password digest) -> (access token, refresh token) of the
+        # last successful login, reused while the access token is still valid
+        self._auth_cache: OrderedDict[tuple[str, bytes], tuple[str, str]] = (
+            OrderedDict()
+        )
 
     def authenticate(self, username: str, password: str) -> TokenResponse:
         """
         Authenticate user and generate tokens.
 
+        Credentials are checked on every call; repeating a recent successful
+        login returns the same tokens while the access token is still valid.
+
         Args:
             username: Username for authentication
             password: User password
@@ -50,41 +100,92 @@ class IDPService:
         """
         logger.info("Authentication attempt", extra={"username": username})
 
-        # Validate credentials
+        candidate = hashlib.sha256(password.encode()).digest()
+        cache_key = (username, candidate)
+
+        # Validate credentials on every attempt; the cache only saves issuing
+        # a new token pair
         user = self._users.get(username)
-        if not user or user["password"] != password:
+        if not user or not hmac.compare_digest(candidate, user["password_hash"]):
+            self._auth_cache.pop(cache_key, None)
             logger.warning("Authentication failed", extra={"username": username})
             raise AuthenticationException("Invalid username or password")
 
         if not user["is_active"]:
+            self._auth_cache.pop(cache_key, None)
             raise AuthenticationException("Account is not active")
 
+        # A repeat of a recent successful login gets the same tokens back
+        now = int(time.time())
+        cached = self._cached_login(cache_key, now)
+        if cached is not None:
+            logger.info(
+                "Authentication successful",
+                extra={"username": username, "reused_tokens": True},
+            )
+            return cached
+
         # Generate tokens
         access_token = self._generate_token()
         refresh_token = self._generate_token()
 
         # Store token mapping
-        self._tokens[access_token] = {
-            "user_id": user["user_id"],
-            "username": username,
-            "type": "access",
-            "expires_at": str(int(time.time()) + 3600),
-        }
-        self._tokens[refresh_token] = {
-            "user_id": user["user_id"],
-            "username": username,
-            "type": "refresh",
-            "expires_at": str(int(time.time()) + 86400),
-        }
+        self._access_tokens[access_token] = TokenRecord(
+            user_id=user["user_id"],
+            username=username,
+            expires_at=now + 3600,
+        )
+        self._refresh_tokens[refresh_token] = TokenRecord(
+            user_id=user["user_id"],
+            username=username,
+            expires_at=now + 86400,
+        )
 
         logger.info("Authentication successful", extra={"username": username})
 
-        return TokenResponse(
+        self._auth_cache[cache_key] = (access_token, refresh_token)
+        if len(self._auth_cache) > _AUTH_CACHE_SIZE:
+            self._auth_cache.popitem(last=False)
+
+        # Response models are built from trusted internal state, so skip
+        # validation here and in the other service methods
+        return TokenResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             expires_in=3600,
         )
 
+    def _cached_login(
+        self, cache_key: tuple[str, bytes], now: int
+    ) -> TokenResponse | None:
+        """
+        Look up the tokens issued for a recent identical login.
+
+        Args:
+            cache_key: Username and password digest of the login
+            now: Current epoch time in seconds
+
+        Returns:
+            TokenResponse | None: Token response with the remaining lifetime,
+                or None if there is no live cached login
+        """
+        cached = self._auth_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        access_token, refresh_token = cached
+        record = self._access_tokens.get(access_token)
+        if record is None or record.expires_at <= now:
+            del self._auth_cache[cache_key]
+            return None
+
+        self._auth_cache.move_to_end(cache_key)
+        return TokenResponse.model_construct(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=record.expires_at - now,
+        )
+
     def get_user_info(self, token: str) -> UserInfo:
         """
         Get user information from access token.
@@ -99,30 +200,83 @@ class IDPService:
             AuthenticationException: When token is invalid
             NotFoundException: When user not found
         """
-        # Validate token
-        token_data = self._tokens.get(token)
-        if not token_data:
-            raise AuthenticationException("Invalid or expired token")
+        token_data = self._validate_access_token(token)
+        return self._build_user_info(token_data.username)
+
+    def get_user_info_json(self, token: str) -> str:
+        """
+        Get serialized user information from access token.
+
+        The JSON body is built once per user and reused for later requests.
+        The cache is never invalidated: it assumes user records are the
+        immutable seed data, so anything that changes a user must drop that
+        user's _user_info_json entry.
+
+        Args:
+            token: Access token
+
+        Returns:
+            str: UserInfo serialized as JSON
+
+        Raises:
+            AuthenticationException: When token is invalid
+            NotFoundException: When user not found
+        """
+        username = self._validate_access_token(token).username
+        try:
+            return self._user_info_json[username]
+        except KeyError:
+            body = self._build_user_info(username).model_dump_json()
+            self._user_info_json[username] = body
+            return body
+
+    def _validate_access_token(self, token: str) -> TokenRecord:
+        """
+        Look up an access token and check it has not expired.
+
+        Args:
+            token: Access token
 
-        if token_data["type"] != "access":
-            raise AuthenticationException("Invalid token type")
+        Returns:
+            TokenRecord: Stored token metadata
+
+        Raises:
+            AuthenticationException: When token is invalid or expired
+        """
+        try:
+            token_data = self._access_tokens[token]
+        except KeyError:
+            raise AuthenticationException("Invalid or expired token") from None
 
         # Check expiration
-        if int(token_data["expires_at"]) < int(time.time()):
+        if token_data.expires_at < time.time():
             raise AuthenticationException("Token has expired")
 
-        # Get user
-        username = token_data["username"]
+        return token_data
+
+    def _build_user_info(self, username: str) -> UserInfo:
+        """
+        Build the UserInfo response for a stored user.
+
+        Args:
+            username: Username of the user
+
+        Returns:
+            UserInfo: User information
+
+        Raises:
+            NotFoundException: When user not found
+        """
         user = self._users.get(username)
         if not user:
             raise NotFoundException("User not found")
 
-        return UserInfo(
+        return UserInfo.model_construct(
             user_id=user["user_id"],
             username=user["username"],
             email=user["email"],
             is_active=user["is_active"],
-            created_at=user["created_at"],
+            created_at=datetime.fromtimestamp(user["created_at_ts"], tz=UTC),
         )
 
     def refresh_token(self, refresh_token: str) -> TokenResponse:
@@ -139,39 +293,49 @@ class IDPService:
             AuthenticationException: When refresh token is invalid
         """
         # Validate refresh token
-        token_data = self._tokens.get(refresh_token)
-        if not token_data:
-            raise AuthenticationException("Invalid refresh token")
-
-        if token_data["type"] != "refresh":
-            raise AuthenticationException("Invalid token type")
+        try:
+            token_data = self._refresh_tokens[refresh_token]
+        except KeyError:
+            raise AuthenticationException("Invalid refresh token") from None
 
         # Check expiration
-        if int(token_data["expires_at"]) < int(time.time()):
+        now = int(time.time())
+        if token_data.expires_at < now:
             raise AuthenticationException("Refresh token has expired")
 
         # Generate new access token
         access_token = self._generate_token()
-        self._tokens[access_token] = {
-            "user_id": token_data["user_id"],
-            "username": token_data["username"],
-            "type": "access",
-            "expires_at": str(int(time.time()) + 3600),
-        }
+        self._access_tokens[access_token] = TokenRecord(
+            user_id=token_data.user_id,
+            username=token_data.username,
+            expires_at=now + 3600,
+        )
 
-        logger.info("Token refreshed", extra={"username": token_data["username"]})
+        logger.info("Token refreshed", extra={"username": token_data.username})
 
-        return TokenResponse(
+        return TokenResponse.model_construct(
             access_token=access_token,
             expires_in=3600,
         )
 
-    @staticmethod
-    def _generate_token() -> str:
+    @classmethod
+    def _generate_token(cls) -> str:
         """
         Generate a secure random token.
 
+        Tokens are drawn from a pool that is refilled from a single
+        secrets.token_bytes call, amortising the OS entropy read across
+        _TOKEN_POOL_SIZE tokens.
+
         Returns:
             str: Random token string
         """
-        return secrets.token_urlsafe(32)
+        if not cls._token_pool:
+            raw = secrets.token_bytes(_TOKEN_BYTES * _TOKEN_POOL_SIZE)
+            cls._token_pool.extend(
+                base64.urlsafe_b64encode(raw[i : i + _TOKEN_BYTES])
+                .rstrip(b"=")
+                .decode("ascii")
+                for i in range(0, len(raw), _TOKEN_BYTES)
+            )
+        return cls._token_pool.pop()
@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from services.idp_api.src import handler
 from services.idp_api.src.handler import lambda_handler
+from services.idp_api.src.service import IDPService
 
 
 @pytest.fixture
@@ -17,6 +19,12 @@ def lambda_context() -> MagicMock:
     return context
 
 
+@pytest.fixture(autouse=True)
+def fresh_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each integration test a fresh handler service."""
+    monkeypatch.setattr(handler, "_SERVICE", IDPService())
+
+
 @pytest.mark.integration
 class TestIDPAPIIntegration:
     """Integration tests for IDP API Lambda end-to-end flows."""
@@ -1,6 +1,7 @@
 """Unit tests for IDP API Lambda handler."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,29 +12,31 @@ from services.idp_api.src.handler import (
     lambda_handler,
 )
 from services.idp_api.src.models import TokenResponse
+from services.idp_api.src.service import IDPService
 
 
 @pytest.fixture
-def lambda_context() -> MagicMock:
-    """Create mock Lambda context."""
-    context = MagicMock()
-    context.request_id = "test-request-id"
-    context.function_name = "idp-api"
-    return context
+def lambda_context() -> SimpleNamespace:
+    """Create stub Lambda context."""
+    return SimpleNamespace(request_id="test-request-id", function_name="idp-api")
 
 
-@pytest.fixture
+# Serialized once; the event fixtures below are shared across the module
+_AUTH_BODY = json.dumps({"username": "testuser", "password": "password123"})
+
+
+@pytest.fixture(scope="module")
 def auth_event() -> dict:
     """Create authentication event."""
     return {
         "httpMethod": "POST",
         "path": "/auth/token",
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"username": "testuser", "password": "password123"}),
+        "body": _AUTH_BODY,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def userinfo_event() -> dict:
     """Create userinfo event."""
     return {
@@ -47,9 +50,9 @@ def userinfo_event() -> dict:
 class TestLambdaHandler:
     """Test cases for lambda_handler function."""
 
-    @patch("services.idp_api.src.handler.IDPService")
+    @patch("services.idp_api.src.handler._SERVICE", spec=IDPService)
     def test_authentication_success(
-        self, mock_service: MagicMock, auth_event: dict, lambda_context: MagicMock
+        self, mock_service: MagicMock, auth_event: dict, lambda_context: SimpleNamespace
     ) -> None:
         """Test successful authentication."""
         # Arrange
@@ -58,7 +61,7 @@ class TestLambdaHandler:
             refresh_token="refresh-456",
             expires_in=3600,
         )
-        mock_service.return_value.authenticate.return_value = mock_token
+        mock_service.authenticate.return_value = mock_token
 
         # Act
         response = lambda_handler(auth_event, lambda_context)
@@ -69,7 +72,27 @@ class TestLambdaHandler:
         assert body["access_token"] == "access-123"
         assert body["refresh_token"] == "refresh-456"
 
-    def test_authentication_missing_body(self, lambda_context: MagicMock) -> None:
+    @patch("services.idp_api.src.handler._SERVICE", spec=IDPService)
+    def test_stage_prefixed_path(
+        self, mock_service: MagicMock, auth_event: dict, lambda_context: SimpleNamespace
+    ) -> None:
+        """Test routing of a path carrying an API Gateway stage prefix."""
+        # Arrange
+        mock_service.authenticate.return_value = TokenResponse(
+            access_token="access-123",
+            refresh_token="refresh-456",
+            expires_in=3600,
+        )
+        event = {**auth_event, "path": "/prod/auth/token"}
+
+        # Act
+        response = lambda_handler(event, lambda_context)
+
+        # Assert
+        assert response["statusCode"] == 200
+        mock_service.authenticate.assert_called_once_with("testuser", "password123")
+
+    def test_authentication_missing_body(self, lambda_context: SimpleNamespace) -> None:
         """Test authentication with missing body."""
         # Arrange
         event = {
@@ -84,7 +107,7 @@ class TestLambdaHandler:
         # Assert
         assert response["statusCode"] == 400
 
-    def test_invalid_endpoint(self, lambda_context: MagicMock) -> None:
+    def test_invalid_endpoint(self, lambda_context: SimpleNamespace) -> None:
         """Test request to invalid endpoint."""
         # Arrange
         event = {
@@ -102,12 +125,12 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert body["error"] == "NOT_FOUND"
 
-    @patch("services.idp_api.src.handler.IDPService")
+    @patch("services.idp_api.src.handler._SERVICE", spec=IDPService)
     def test_userinfo_success(
         self,
         mock_service: MagicMock,
         userinfo_event: dict,
-        lambda_context: MagicMock,
+        lambda_context: SimpleNamespace,
     ) -> None:
         """Test successful userinfo retrieval."""
         # Arrange
@@ -118,7 +141,7 @@ class TestLambdaHandler:
             username="testuser",
             email="test@example.com",
         )
-        mock_service.return_value.get_user_info.return_value = mock_user
+        mock_service.get_user_info_json.return_value = mock_user.model_dump_json()
 
         # Act
         response = lambda_handler(userinfo_event, lambda_context)
@@ -128,7 +151,9 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert body["username"] == "testuser"
 
-    def test_userinfo_missing_auth_header(self, lambda_context: MagicMock) -> None:
+    def test_userinfo_missing_auth_header(
+        self, lambda_context: SimpleNamespace
+    ) -> None:
         """Test userinfo with missing authorization header."""
         # Arrange
         event = {
@@ -143,12 +168,37 @@ class TestLambdaHandler:
 
         # Assert
         assert response["statusCode"] == 400
+        body = json.loads(response["body"])
+        assert body["error"] == "VALIDATION_ERROR"
+        assert body["message"] == "Invalid or missing Authorization header"
+
+    def test_responses_do_not_share_state(
+        self, lambda_context: SimpleNamespace
+    ) -> None:
+        """Test mutating one response does not leak into the next."""
+        # Arrange
+        event = {
+            "httpMethod": "GET",
+            "path": "/auth/userinfo",
+            "headers": {},
+            "body": "",
+        }
+        first = lambda_handler(event, lambda_context)
+        first["headers"]["X-Extra"] = "1"
+        first["statusCode"] = 500
+
+        # Act
+        second = lambda_handler(event, lambda_context)
+
+        # Assert
+        assert second["statusCode"] == 400
+        assert "X-Extra" not in second["headers"]
 
 
 class TestHandleAuthentication:
     """Test cases for handle_authentication function."""
 
-    @patch("services.idp_api.src.handler.IDPService")
+    @patch("services.idp_api.src.handler._SERVICE", spec=IDPService)
     def test_valid_credentials(self, mock_service: MagicMock) -> None:
         """Test authentication with valid credentials."""
         # Arrange
@@ -158,7 +208,7 @@ class TestHandleAuthentication:
             refresh_token="refresh-456",
             expires_in=3600,
         )
-        mock_service.return_value.authenticate.return_value = mock_token
+        mock_service.authenticate.return_value = mock_token
 
         # Act
         response = handle_authentication(body)
@@ -1,11 +1,28 @@
 """Unit tests for IDP API service."""
 
+import json
+import time
+
 import pytest
 from libs.common.src.exceptions import AuthenticationException
 
+from services.idp_api.src import service as service_module
+from services.idp_api.src.models import TokenResponse
 from services.idp_api.src.service import IDPService
 
 
+@pytest.fixture(scope="module")
+def idp_service() -> IDPService:
+    """Create one service instance shared by the module's token tests."""
+    return IDPService()
+
+
+@pytest.fixture(scope="module")
+def authenticated_token(idp_service: IDPService) -> TokenResponse:
+    """Authenticate the demo user once and reuse the issued tokens."""
+    return idp_service.authenticate("testuser", "password123")
+
+
 class TestIDPService:
     """Test cases for IDPService class."""
 
@@ -25,40 +42,47 @@ class TestIDPService:
         assert token_response.expires_in == 3600
         assert token_response.token_type == "Bearer"
 
-    def test_authenticate_invalid_username(self) -> None:
-        """Test authentication with invalid username."""
-        # Arrange
-        service = IDPService()
-
-        # Act & Assert
-        with pytest.raises(AuthenticationException) as exc_info:
-            service.authenticate("invaliduser", "password123")
-        assert "Invalid username or password" in str(exc_info.value)
-
-    def test_authenticate_invalid_password(self) -> None:
-        """Test authentication with invalid password."""
+    @pytest.mark.parametrize(
+        ("username", "password"),
+        [("invaliduser", "password123"), ("testuser", "wrongpassword")],
+        ids=["invalid_username", "invalid_password"],
+    )
+    def test_authenticate_invalid_credentials(
+        self, username: str, password: str
+    ) -> None:
+        """Test authentication with an invalid username or password."""
         # Arrange
         service = IDPService()
 
         # Act & Assert
         with pytest.raises(AuthenticationException) as exc_info:
-            service.authenticate("testuser", "wrongpassword")
+            service.authenticate(username, password)
         assert "Invalid username or password" in str(exc_info.value)
 
-    def test_get_user_info_valid_token(self) -> None:
+    def test_get_user_info_valid_token(
+        self, idp_service: IDPService, authenticated_token: TokenResponse
+    ) -> None:
         """Test getting user info with valid token."""
-        # Arrange
-        service = IDPService()
-        token_response = service.authenticate("testuser", "password123")
-
         # Act
-        user_info = service.get_user_info(token_response.access_token)
+        user_info = idp_service.get_user_info(authenticated_token.access_token)
 
         # Assert
         assert user_info.username == "testuser"
         assert user_info.email == "testuser@example.com"
         assert user_info.is_active is True
 
+    def test_get_user_info_json_is_cached(
+        self, idp_service: IDPService, authenticated_token: TokenResponse
+    ) -> None:
+        """Test serialized user info is built once and reused."""
+        # Act
+        first = idp_service.get_user_info_json(authenticated_token.access_token)
+        second = idp_service.get_user_info_json(authenticated_token.access_token)
+
+        # Assert
+        assert json.loads(first)["email"] == "testuser@example.com"
+        assert second is first
+
     def test_get_user_info_invalid_token(self) -> None:
         """Test getting user info with invalid token."""
         # Arrange
@@ -69,29 +93,27 @@ class TestIDPService:
             service.get_user_info("invalid-token")
         assert "Invalid or expired token" in str(exc_info.value)
 
-    def test_get_user_info_wrong_token_type(self) -> None:
+    def test_get_user_info_wrong_token_type(
+        self, idp_service: IDPService, authenticated_token: TokenResponse
+    ) -> None:
         """Test getting user info with refresh token instead of access token."""
-        # Arrange
-        service = IDPService()
-        token_response = service.authenticate("testuser", "password123")
-
         # Act & Assert
         with pytest.raises(AuthenticationException) as exc_info:
-            service.get_user_info(token_response.refresh_token)  # type: ignore
-        assert "Invalid token type" in str(exc_info.value)
+            idp_service.get_user_info(authenticated_token.refresh_token)  # type: ignore
+        assert "Invalid or expired token" in str(exc_info.value)
 
-    def test_refresh_token_valid(self) -> None:
+    def test_refresh_token_valid(
+        self, idp_service: IDPService, authenticated_token: TokenResponse
+    ) -> None:
         """Test token refresh with valid refresh token."""
-        # Arrange
-        service = IDPService()
-        initial_token = service.authenticate("testuser", "password123")
-
         # Act
-        new_token = service.refresh_token(initial_token.refresh_token)  # type: ignore
+        new_token = idp_service.refresh_token(
+            authenticated_token.refresh_token  # type: ignore
+        )
 
         # Assert
         assert new_token.access_token is not None
-        assert new_token.access_token != initial_token.access_token
+        assert new_token.access_token != authenticated_token.access_token
         assert new_token.expires_in == 3600
 
     def test_refresh_token_invalid(self) -> None:
@@ -104,13 +126,64 @@ class TestIDPService:
             service.refresh_token("invalid-refresh-token")
         assert "Invalid refresh token" in str(exc_info.value)
 
-    def test_refresh_token_wrong_type(self) -> None:
+    def test_refresh_token_wrong_type(
+        self, idp_service: IDPService, authenticated_token: TokenResponse
+    ) -> None:
         """Test token refresh with access token instead of refresh token."""
+        # Act & Assert
+        with pytest.raises(AuthenticationException) as exc_info:
+            idp_service.refresh_token(authenticated_token.access_token)
+        assert "Invalid refresh token" in str(exc_info.value)
+
+    def test_repeated_login_reuses_tokens(self) -> None:
+        """Test a repeated login returns the tokens from the previous one."""
+        # Arrange
+        service = IDPService()
+        first = service.authenticate("testuser", "password123")
+
+        # Act
+        second = service.authenticate("testuser", "password123")
+
+        # Assert
+        assert second.access_token == first.access_token
+        assert second.refresh_token == first.refresh_token
+        assert 0 < second.expires_in <= 3600
+
+    def test_repeated_login_after_expiry_issues_new_tokens(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cached login is not reused once its access token expires."""
         # Arrange
         service = IDPService()
-        token_response = service.authenticate("testuser", "password123")
+        first = service.authenticate("testuser", "password123")
+        later = time.time() + 3601
+        monkeypatch.setattr(service_module.time, "time", lambda: later)
+
+        # Act
+        second = service.authenticate("testuser", "password123")
+
+        # Assert
+        assert second.access_token != first.access_token
+        assert second.refresh_token != first.refresh_token
+        assert second.expires_in == 3600
+
+    def test_repeated_login_rejected_after_deactivation(self) -> None:
+        """Test a cached login is not reused once the account is inactive."""
+        # Arrange
+        service = IDPService()
+        service.authenticate("testuser", "password123")
+        service._users["testuser"]["is_active"] = False
 
         # Act & Assert
         with pytest.raises(AuthenticationException) as exc_info:
-            service.refresh_token(token_response.access_token)
-        assert "Invalid token type" in str(exc_info.value)
+            service.authenticate("testuser", "password123")
+        assert "Account is not active" in str(exc_info.value)
+
+    def test_tokens_are_scoped_to_service_instance(self) -> None:
+        """Test tokens issued by one service instance are unknown to another."""
+        # Arrange
+        token_response = IDPService().authenticate("testuser", "password123")
+
+        # Act & Assert
+        with pytest.raises(AuthenticationException):
+            IDPService().get_user_info(token_response.access_token)
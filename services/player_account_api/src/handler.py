@@ -1,30 +1,87 @@
 """Lambda handler for Player Account API."""
 
-import json
+import logging
+import re
+from collections.abc import Callable
 from typing import Any
 
+import orjson
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from libs.common.src.clock import reset_request_clock, start_request_clock
 from libs.common.src.exceptions import PSNEmulatorException, ValidationException
 from libs.common.src.logger import get_logger
-from libs.common.src.models import ErrorResponse
 from pydantic import ValidationError
 
 # Try absolute imports first (for Docker), then relative imports (for local testing)
 try:
     from models import (
-        CreatePlayerRequest,
-        UpdatePlayerRequest,
+        CREATE_PLAYER_ADAPTER,
+        PLAYER_LIST_ADAPTER,
+        UPDATE_PLAYER_ADAPTER,
     )
     from service import PlayerAccountService
 except ImportError:
     from .models import (
-        CreatePlayerRequest,
-        UpdatePlayerRequest,
+        CREATE_PLAYER_ADAPTER,
+        PLAYER_LIST_ADAPTER,
+        UPDATE_PLAYER_ADAPTER,
     )
     from .service import PlayerAccountService
 
 logger = get_logger(__name__)
 
+# Reused across warm invocations instead of being rebuilt per request
+_SERVICE = PlayerAccountService()
+
+_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+}
+
+# Pre-built 404 envelope; the message is JSON-encoded so odd paths stay valid
+_NOT_FOUND_TMPL = '{"error":"NOT_FOUND","message":%s}'
+
+# Body of the fixed missing player_id 400 response, encoded once at import
+_MISSING_PLAYER_ID_BODY = orjson.dumps(
+    {"error": "BAD_REQUEST", "message": "player_id is required"}
+).decode()
+
+# Shared empty mapping for missing path parameters/body; treat as read-only
+_EMPTY: dict[str, Any] = {}
+
+_PLAYERS_RESOURCE = "/players"
+_PLAYER_RESOURCE = "/players/{player_id}"
+_PLAYER_STATS_RESOURCE = "/players/{player_id}/stats"
+
+# Fallback matcher for events without a "resource" field. Searching (rather
+# than anchoring at the start) also matches stage-prefixed paths like /prod/players
+_PATH_RE = re.compile(r"/players(?:/(?P<player_id>[^/]+)(?P<stats>/stats)?)?$")
+_RESOURCE_BY_SHAPE = {
+    (False, False): _PLAYERS_RESOURCE,
+    (True, False): _PLAYER_RESOURCE,
+    (True, True): _PLAYER_STATS_RESOURCE,
+}
+
+# Resources that require a player_id path parameter
+_PLAYER_RESOURCES = frozenset({_PLAYER_RESOURCE, _PLAYER_STATS_RESOURCE})
+
+# Route table keyed by (HTTP method, API Gateway resource template).
+# Every route is called with (player_id, body).
+_ROUTES: dict[tuple[str, str], Callable[[Any, dict[str, Any]], dict[str, Any]]] = {
+    ("POST", _PLAYERS_RESOURCE): lambda _player_id, body: handle_create_player(body),
+    ("GET", _PLAYERS_RESOURCE): lambda _player_id, _body: handle_list_players(),
+    ("GET", _PLAYER_RESOURCE): lambda player_id, _body: handle_get_player(player_id),
+    ("PUT", _PLAYER_RESOURCE): lambda player_id, body: handle_update_player(
+        player_id, body
+    ),
+    ("DELETE", _PLAYER_RESOURCE): lambda player_id, _body: handle_delete_player(
+        player_id
+    ),
+    ("GET", _PLAYER_STATS_RESOURCE): lambda player_id, _body: handle_get_player_stats(
+        player_id
+    ),
+}
+
 
 def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str, Any]:
     """
@@ -44,53 +101,43 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
         ValidationException: When request validation fails
         PSNEmulatorException: For other service-level errors
     """
-    logger.info(
-        "Player Account API request received", extra={"path": event.get("path")}
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Player Account API request received", extra={"path": event.get("path")}
+        )
 
+    clock_token = start_request_clock()
     try:
         http_method = event.get("httpMethod", "")
         path = event.get("path", "")
-        path_params = event.get("pathParameters") or {}
-        body = json.loads(event.get("body", "{}")) if event.get("body") else {}
-
-        # Route to appropriate handler - check more specific paths first
-        if http_method == "POST" and path.endswith("/players"):
-            return handle_create_player(body)
-        elif http_method == "GET" and path.endswith("/players"):
-            return handle_list_players()
-        elif http_method == "GET" and "/players/" in path and path.endswith("/stats"):
-            player_id = path_params.get("player_id")
-            if not player_id:
-                return create_error_response(
-                    400, "BAD_REQUEST", "player_id is required"
-                )
-            return handle_get_player_stats(player_id)
-        elif http_method == "GET" and "/players/" in path:
-            player_id = path_params.get("player_id")
-            if not player_id:
-                return create_error_response(
-                    400, "BAD_REQUEST", "player_id is required"
-                )
-            return handle_get_player(player_id)
-        elif http_method == "PUT" and "/players/" in path:
-            player_id = path_params.get("player_id")
-            if not player_id:
-                return create_error_response(
-                    400, "BAD_REQUEST", "player_id is required"
-                )
-            return handle_update_player(player_id, body)
-        elif http_method == "DELETE" and "/players/" in path:
-            player_id = path_params.get("player_id")
-            if not player_id:
-                return create_error_response(
-                    400, "BAD_REQUEST", "player_id is required"
-                )
-            return handle_delete_player(player_id)
-        else:
-            return create_error_response(
-                404, "NOT_FOUND", f"Endpoint not found: {http_method} {path}"
-            )
+        raw_body = event.get("body")
+        path_params = event.get("pathParameters") or _EMPTY
+        body = orjson.loads(raw_body) if raw_body else _EMPTY
+
+        # API Gateway provides the matched route template in "resource"; only
+        # fall back to inspecting the raw path for direct (non-APIGW) invokes
+        resource = event.get("resource")
+        path_player_id = None
+        if not resource:
+            resource, path_player_id = _match_path(path)
+        route = _ROUTES.get((http_method, resource))
+        if route is None:
+            return {
+                "statusCode": 404,
+                "headers": {**_JSON_HEADERS},
+                "body": _NOT_FOUND_TMPL
+                % orjson.dumps(f"Endpoint not found: {http_method} {path}").decode(),
+            }
+
+        player_id = path_params.get("player_id") or path_player_id
+        if resource in _PLAYER_RESOURCES and not player_id:
+            return {
+                "statusCode": 400,
+                "headers": {**_JSON_HEADERS},
+                "body": _MISSING_PLAYER_ID_BODY,
+            }
+
+        return route(player_id, body)
 
     except ValidationException as e:
         logger.warning("Validation error", extra={"error": str(e)})
@@ -106,20 +153,48 @@ def lambda_handler(event: dict[str, Any], _context: LambdaContext) -> dict[str,
             500, "INTERNAL_ERROR", "An unexpected error occurred"
         )
 
+    finally:
+        reset_request_clock(clock_token)
+
+
+def _match_path(path: str) -> tuple[str | None, str | None]:
+    """
+    Map a raw request path to its API Gateway resource template.
+
+    Used only when the event carries no "resource" field.
+
+    Args:
+        path: Raw request path
 
-def handle_create_player(body: dict[str, Any]) -> dict[str, Any]:
+    Returns:
+        tuple: Matching resource template (None if unknown) and player_id
+    """
+    match = _PATH_RE.search(path)
+    if match is None:
+        return None, None
+    player_id = match["player_id"]
+    return (
+        _RESOURCE_BY_SHAPE[(player_id is not None, match["stats"] is not None)],
+        player_id,
+    )
+
+
+def handle_create_player(
+    body: dict[str, Any], service: PlayerAccountService | None = None
+) -> dict[str, Any]:
     """
     Handle create player request.
 
     Args:
         body: Request body with player data
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with created player
     """
     try:
-        request = CreatePlayerRequest(**body)
-        service = PlayerAccountService()
+        request = CREATE_PLAYER_ADAPTER.validate_python(body)
+        service = service or _SERVICE
         player = service.create_player(
             username=request.username,
             email=request.email,
@@ -131,35 +206,43 @@ def handle_create_player(body: dict[str, Any]) -> dict[str, Any]:
         raise ValidationException(str(e)) from e
 
 
-def handle_get_player(player_id: str) -> dict[str, Any]:
+def handle_get_player(
+    player_id: str, service: PlayerAccountService | None = None
+) -> dict[str, Any]:
     """
     Handle get player request.
 
     Args:
         player_id: Player identifier
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with player data
     """
-    service = PlayerAccountService()
+    service = service or _SERVICE
     player = service.get_player(player_id)
     return create_success_response(200, player.model_dump_json())
 
 
-def handle_update_player(player_id: str, body: dict[str, Any]) -> dict[str, Any]:
+def handle_update_player(
+    player_id: str,
+    body: dict[str, Any],
+    service: PlayerAccountService | None = None,
+) -> dict[str, Any]:
     """
     Handle update player request.
 
     Args:
         player_id: Player identifier
         body: Request body with update data
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with updated player
     """
     try:
-        request = UpdatePlayerRequest(**body)
-        service = PlayerAccountService()
+        request = UPDATE_PLAYER_ADAPTER.validate_python(body)
+        service = service or _SERVICE
         player = service.update_player(player_id, request)
         return create_success_response(200, player.model_dump_json())
 
@@ -167,48 +250,60 @@ def handle_update_player(player_id: str, body: dict[str, Any]) -> dict[str, Any]
         raise ValidationException(str(e)) from e
 
 
-def handle_delete_player(player_id: str) -> dict[str, Any]:
+def handle_delete_player(
+    player_id: str, service: PlayerAccountService | None = None
+) -> dict[str, Any]:
     """
     Handle delete player request.
 
     Args:
         player_id: Player identifier
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response confirming deletion
     """
-    service = PlayerAccountService()
+    service = service or _SERVICE
     service.delete_player(player_id)
     return create_success_response(204, {})
 
 
-def handle_list_players() -> dict[str, Any]:
+def handle_list_players(service: PlayerAccountService | None = None) -> dict[str, Any]:
     """
     Handle list players request.
 
+    Args:
+        service: Service to use (defaults to the shared module instance)
+
     Returns:
         dict: API Gateway response with list of players
     """
-    service = PlayerAccountService()
+    service = service or _SERVICE
     players = service.list_players()
+    # pydantic-core encodes the accounts straight to JSON; orjson embeds the
+    # bytes as-is instead of re-encoding an intermediate list of dicts. The
+    # serializer accepts iterators but not dict views, hence iter()
     players_data = {
-        "players": [json.loads(p.model_dump_json()) for p in players],
+        "players": orjson.Fragment(PLAYER_LIST_ADAPTER.dump_json(iter(players))),
         "count": len(players),
     }
     return create_success_response(200, players_data)
 
 
-def handle_get_player_stats(player_id: str) -> dict[str, Any]:
+def handle_get_player_stats(
+    player_id: str, service: PlayerAccountService | None = None
+) -> dict[str, Any]:
     """
     Handle get player stats request.
 
     Args:
         player_id: Player identifier
+        service: Service to use (defaults to the shared module instance)
 
     Returns:
         dict: API Gateway response with player statistics
     """
-    service = PlayerAccountService()
+    service = service or _SERVICE
     stats = service.get_player_stats(player_id)
     return create_success_response(200, stats.model_dump_json())
 
@@ -226,13 +321,13 @@ def create_success_response(
     Returns:
         dict: Formatted API Gateway response
     """
-    body = data if isinstance(data, str) else (json.dumps(data) if data else "")
+    # orjson emits UTF-8 bytes (non-ASCII is not escaped), so decode once here
+    body = (
+        data if isinstance(data, str) else (orjson.dumps(data).decode() if data else "")
+    )
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-        },
+        "headers": {**_JSON_HEADERS},
         "body": body,
     }
 
@@ -251,13 +346,10 @@ def create_error_response(
     Returns:
         dict: Formatted API Gateway error response
     """
-    error_response = ErrorResponse(error=error_type, message=message)
-
+    # The envelope shape is fixed, so encode it directly rather than building
+    # and validating an ErrorResponse model for an outgoing payload
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-        },
-        "body": error_response.model_dump_json(),
+        "headers": {**_JSON_HEADERS},
+        "body": orjson.dumps({"error": error_type, "message": message}).decode(),
     }
@@ -1,9 +1,17 @@
 """Pydantic models for Player Account API Lambda."""
 
+import os
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from libs.common.src.clock import utc_now
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Basic email shape check, run by pydantic-core's regex engine. Replaces
+# EmailStr so the email-validator package is neither imported nor run
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
 
 class PlayerStatus(str, Enum):
@@ -19,7 +27,7 @@ class CreatePlayerRequest(BaseModel):
     """Request model for creating a player account."""
 
     username: str = Field(min_length=3, max_length=30, description="Player username")
-    email: EmailStr = Field(description="Player email address")
+    email: str = Field(pattern=EMAIL_PATTERN, description="Player email address")
     display_name: str | None = Field(
         default=None, max_length=50, description="Player display name"
     )
@@ -31,7 +39,9 @@ class UpdatePlayerRequest(BaseModel):
     display_name: str | None = Field(
         default=None, max_length=50, description="Updated display name"
     )
-    email: EmailStr | None = Field(default=None, description="Updated email address")
+    email: str | None = Field(
+        default=None, pattern=EMAIL_PATTERN, description="Updated email address"
+    )
     status: PlayerStatus | None = Field(
         default=None, description="Updated account status"
     )
@@ -40,11 +50,13 @@ class UpdatePlayerRequest(BaseModel):
 class PlayerAccount(BaseModel):
     """Player account model."""
 
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
+    model_config = ConfigDict(
+        frozen=True, json_encoders={datetime: lambda v: v.isoformat()}
+    )
 
     player_id: str = Field(description="Unique player identifier")
     username: str = Field(description="Player username")
-    email: EmailStr = Field(description="Player email address")
+    email: str = Field(pattern=EMAIL_PATTERN, description="Player email address")
     display_name: str = Field(description="Player display name")
     status: PlayerStatus = Field(
         default=PlayerStatus.ACTIVE, description="Account status"
@@ -52,16 +64,34 @@ class PlayerAccount(BaseModel):
     level: int = Field(default=1, ge=1, le=100, description="Player level")
     experience_points: int = Field(default=0, ge=0, description="Total XP")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Account creation timestamp"
+        default_factory=utc_now, description="Account creation timestamp"
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Last update timestamp"
+        default_factory=utc_now, description="Last update timestamp"
     )
 
+    @classmethod
+    def from_db(cls, row: dict[str, Any]) -> Self:
+        """
+        Build a player account from a trusted storage row without validation.
+
+        Only use this for data that was validated before it was stored;
+        external input must go through the request models instead.
+
+        Args:
+            row: Field values read from storage
+
+        Returns:
+            PlayerAccount: Model instance
+        """
+        return cls.model_construct(**row)
+
 
 class PlayerStats(BaseModel):
     """Player statistics model."""
 
+    model_config = ConfigDict(frozen=True)
+
     player_id: str = Field(description="Player identifier")
     total_games: int = Field(default=0, ge=0, description="Total games played")
     wins: int = Field(default=0, ge=0, description="Total wins")
@@ -70,3 +100,54 @@ class PlayerStats(BaseModel):
     total_playtime_hours: int = Field(
         default=0, ge=0, description="Total playtime in hours"
     )
+
+    @classmethod
+    def from_db(cls, row: dict[str, Any]) -> Self:
+        """
+        Build player stats from a trusted storage row without validation.
+
+        Only use this for data that was validated before it was stored;
+        external input must go through the request models instead.
+
+        Args:
+            row: Field values read from storage
+
+        Returns:
+            PlayerStats: Model instance
+        """
+        return cls.model_construct(**row)
+
+
+# Adapters built once at import and reused on every request. The player list
+# adapter takes any iterable so storage views can be dumped without a copy
+PLAYER_LIST_ADAPTER = TypeAdapter(Iterable[PlayerAccount])
+CREATE_PLAYER_ADAPTER = TypeAdapter(CreatePlayerRequest)
+UPDATE_PLAYER_ADAPTER = TypeAdapter(UpdatePlayerRequest)
+
+
+def _warm_up() -> None:
+    """Run each request validator and the list serializer once."""
+    CREATE_PLAYER_ADAPTER.validate_python(
+        {"username": "warmup", "email": "warmup@example.com"}
+    )
+    UPDATE_PLAYER_ADAPTER.validate_python({})
+    PLAYER_LIST_ADAPTER.dump_json(
+        iter(
+            [
+                PlayerAccount.from_db(
+                    {
+                        "player_id": "plr_warmup",
+                        "username": "warmup",
+                        "email": "warmup@example.com",
+                        "display_name": "warmup",
+                    }
+                )
+            ]
+        )
+    )
+
+
+# Only set inside Lambda, so the warm-up runs during INIT (for any
+# initialization type) and is skipped for local runs and tests
+if "AWS_LAMBDA_INITIALIZATION_TYPE" in os.environ:
+    _warm_up()
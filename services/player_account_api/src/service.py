@@ -1,8 +1,10 @@
 """Business logic for Player Account API."""
 
 import secrets
-from datetime import datetime
+from collections.abc import Collection
+from typing import Any
 
+from libs.common.src.clock import utc_now
 from libs.common.src.exceptions import ConflictException, NotFoundException
 from libs.common.src.logger import get_logger
 
@@ -24,23 +26,19 @@ except ImportError:
 
 logger = get_logger(__name__)
 
-# Module-level storage for persistence across service instances (for demo/integration testing)
-# In production, this would be replaced with DynamoDB
-_players_storage: dict[str, PlayerAccount] = {}
-_stats_storage: dict[str, PlayerStats] = {}
-
 
 class PlayerAccountService:
     """Service class for Player Account operations."""
 
-    def __init__(self, reset_storage: bool = False) -> None:
-        # Use module-level storage for persistence across handler calls
+    def __init__(self) -> None:
+        # Per-instance in-memory storage; the handler keeps one long-lived
+        # instance so data persists across warm invocations.
         # In production, replace with DynamoDB
-        if reset_storage:
-            _players_storage.clear()
-            _stats_storage.clear()
-        self._players = _players_storage
-        self._stats = _stats_storage
+        self._players: dict[str, PlayerAccount] = {}
+        self._stats: dict[str, PlayerStats] = {}
+        # Secondary indexes (username/email -> player_id) for O(1) uniqueness checks
+        self._by_username: dict[str, str] = {}
+        self._by_email: dict[str, str] = {}
 
     def create_player(
         self, username: str, email: str, display_name: str | None = None
@@ -61,31 +59,35 @@ class PlayerAccountService:
         """
         logger.info("Creating player account", extra={"username": username})
 
-        # Check for existing username
-        for player in self._players.values():
-            if player.username == username:
-                raise ConflictException(f"Username '{username}' already exists")
-            if player.email == email:
-                raise ConflictException(f"Email '{email}' already exists")
+        # Check for existing username/email
+        if username in self._by_username:
+            raise ConflictException(f"Username '{username}' already exists")
+        if email in self._by_email:
+            raise ConflictException(f"Email '{email}' already exists")
 
         # Generate player ID
         player_id = f"plr_{secrets.token_hex(8)}"
 
-        # Create player account
-        player = PlayerAccount(
-            player_id=player_id,
-            username=username,
-            email=email,
-            display_name=display_name or username,
-            status=PlayerStatus.ACTIVE,
+        # Create player account. Inputs were validated by CreatePlayerRequest at
+        # the handler boundary, so the stored records skip re-validation
+        player = PlayerAccount.from_db(
+            {
+                "player_id": player_id,
+                "username": username,
+                "email": email,
+                "display_name": display_name or username,
+                "status": PlayerStatus.ACTIVE,
+            }
         )
 
         # Initialize player stats
-        stats = PlayerStats(player_id=player_id)
+        stats = PlayerStats.from_db({"player_id": player_id})
 
         # Store in memory
         self._players[player_id] = player
         self._stats[player_id] = stats
+        self._by_username[username] = player_id
+        self._by_email[email] = player_id
 
         logger.info(
             "Player account created",
@@ -107,11 +109,10 @@ class PlayerAccountService:
         Raises:
             NotFoundException: When player not found
         """
-        player = self._players.get(player_id)
-        if not player:
-            raise NotFoundException(f"Player with ID '{player_id}' not found")
-
-        return player
+        try:
+            return self._players[player_id]
+        except KeyError:
+            raise NotFoundException(f"Player with ID '{player_id}' not found") from None
 
     def update_player(
         self, player_id: str, update_request: UpdatePlayerRequest
@@ -134,23 +135,28 @@ class PlayerAccountService:
 
         player = self.get_player(player_id)
 
+        # Only a changed email needs a conflict check and re-indexing
+        new_email = update_request.email
+        if new_email == player.email:
+            new_email = None
+
         # Check for email conflict
-        if update_request.email:
-            for pid, p in self._players.items():
-                if pid != player_id and p.email == update_request.email:
-                    raise ConflictException(
-                        f"Email '{update_request.email}' already exists"
-                    )
-
-        # Update fields
+        if new_email is not None and new_email in self._by_email:
+            raise ConflictException(f"Email '{new_email}' already exists")
+
+        # Accounts are immutable, so store an updated copy
+        changes: dict[str, Any] = {"updated_at": utc_now()}
         if update_request.display_name is not None:
-            player.display_name = update_request.display_name
-        if update_request.email is not None:
-            player.email = update_request.email
+            changes["display_name"] = update_request.display_name
+        if new_email is not None:
+            del self._by_email[player.email]
+            self._by_email[new_email] = player_id
+            changes["email"] = new_email
         if update_request.status is not None:
-            player.status = update_request.status
+            changes["status"] = update_request.status
 
-        player.updated_at = datetime.utcnow()
+        player = player.model_copy(update=changes)
+        self._players[player_id] = player
 
         logger.info("Player account updated", extra={"player_id": player_id})
 
@@ -168,24 +174,29 @@ class PlayerAccountService:
         """
         logger.info("Deleting player account", extra={"player_id": player_id})
 
-        if player_id not in self._players:
-            raise NotFoundException(f"Player with ID '{player_id}' not found")
+        try:
+            player = self._players.pop(player_id)
+        except KeyError:
+            raise NotFoundException(f"Player with ID '{player_id}' not found") from None
 
-        # Remove player and stats
-        del self._players[player_id]
-        if player_id in self._stats:
-            del self._stats[player_id]
+        # Remove stats and index entries
+        self._stats.pop(player_id, None)
+        del self._by_username[player.username]
+        del self._by_email[player.email]
 
         logger.info("Player account deleted", extra={"player_id": player_id})
 
-    def list_players(self) -> list[PlayerAccount]:
+    def list_players(self) -> Collection[PlayerAccount]:
         """
         List all player accounts.
 
+        Returns a live view over the stored players rather than a copy; wrap
+        it in list() if you need to sort, slice or hold it across writes.
+
         Returns:
-            list[PlayerAccount]: List of all players
+            Collection[PlayerAccount]: View of all players
         """
-        return list(self._players.values())
+        return self._players.values()
 
     def get_player_stats(self, player_id: str) -> PlayerStats:
         """
@@ -198,13 +209,11 @@ class PlayerAccountService:
             PlayerStats: Player statistics
 
         Raises:
-            NotFoundException: When player or stats not found
+            NotFoundException: When player not found
         """
-        # Verify player exists
-        self.get_player(player_id)
-
-        stats = self._stats.get(player_id)
-        if not stats:
-            raise NotFoundException(f"Stats for player '{player_id}' not found")
-
-        return stats
+        # Stats are created and removed together with the player, so a single
+        # lookup also covers the player existence check
+        try:
+            return self._stats[player_id]
+        except KeyError:
+            raise NotFoundException(f"Player with ID '{player_id}' not found") from None
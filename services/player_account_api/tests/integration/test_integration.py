@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from services.player_account_api.src import handler
 from services.player_account_api.src.handler import lambda_handler
+from services.player_account_api.src.service import PlayerAccountService
 
 
 @pytest.fixture
@@ -18,12 +20,9 @@ def lambda_context() -> MagicMock:
 
 
 @pytest.fixture(autouse=True)
-def reset_storage() -> None:
-    """Reset storage before each integration test."""
-    from services.player_account_api.src.service import _players_storage, _stats_storage
-
-    _players_storage.clear()
-    _stats_storage.clear()
+def fresh_service(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each integration test a fresh handler service."""
+    monkeypatch.setattr(handler, "_SERVICE", PlayerAccountService())
 
 
 @pytest.mark.integration
@@ -52,6 +51,7 @@ class TestPlayerAccountAPIIntegration:
 
         create_body = json.loads(create_response["body"])
         player_id = create_body["player_id"]
+        assert create_body["created_at"] == create_body["updated_at"]
 
         # Step 2: Get player
         get_event = {
@@ -5,8 +5,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from services.player_account_api.src.handler import lambda_handler
-from services.player_account_api.src.models import PlayerAccount
+from services.player_account_api.src.handler import handle_get_player, lambda_handler
+from services.player_account_api.src.models import PlayerAccount, PlayerStats
 
 
 @pytest.fixture
@@ -51,7 +51,7 @@ def get_player_event() -> dict:
 class TestPlayerAccountHandler:
     """Test cases for Player Account Lambda handler."""
 
-    @patch("services.player_account_api.src.handler.PlayerAccountService")
+    @patch("services.player_account_api.src.handler._SERVICE")
     def test_create_player_success(
         self,
         mock_service: MagicMock,
@@ -66,7 +66,7 @@ class TestPlayerAccountHandler:
             email="player@example.com",
             display_name="New Player",
         )
-        mock_service.return_value.create_player.return_value = mock_player
+        mock_service.create_player.return_value = mock_player
 
         # Act
         response = lambda_handler(create_player_event, lambda_context)
@@ -76,7 +76,28 @@ class TestPlayerAccountHandler:
         body = json.loads(response["body"])
         assert body["username"] == "newplayer"
 
-    @patch("services.player_account_api.src.handler.PlayerAccountService")
+    @patch("services.player_account_api.src.handler._SERVICE")
+    def test_create_player_invalid_email(
+        self,
+        mock_service: MagicMock,
+        create_player_event: dict,
+        lambda_context: MagicMock,
+    ) -> None:
+        """Test player creation rejects a malformed email."""
+        # Arrange
+        create_player_event["body"] = json.dumps(
+            {"username": "newplayer", "email": "not-an-email"}
+        )
+
+        # Act
+        response = lambda_handler(create_player_event, lambda_context)
+
+        # Assert
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"] == "VALIDATION_ERROR"
+        mock_service.create_player.assert_not_called()
+
+    @patch("services.player_account_api.src.handler._SERVICE")
     def test_get_player_success(
         self,
         mock_service: MagicMock,
@@ -91,7 +112,7 @@ class TestPlayerAccountHandler:
             email="test@example.com",
             display_name="Test Player",
         )
-        mock_service.return_value.get_player.return_value = mock_player
+        mock_service.get_player.return_value = mock_player
 
         # Act
         response = lambda_handler(get_player_event, lambda_context)
@@ -101,6 +122,52 @@ class TestPlayerAccountHandler:
         body = json.loads(response["body"])
         assert body["player_id"] == "plr_123"
 
+    @patch("services.player_account_api.src.handler._SERVICE")
+    def test_routes_by_api_gateway_resource(
+        self, mock_service: MagicMock, lambda_context: MagicMock
+    ) -> None:
+        """Test routing uses the API Gateway resource template when present."""
+        # Arrange
+        event = {
+            "httpMethod": "GET",
+            "resource": "/players/{player_id}/stats",
+            "path": "/prod/players/plr_123/stats",
+            "headers": {},
+            "body": None,
+            "pathParameters": {"player_id": "plr_123"},
+        }
+        mock_service.get_player_stats.return_value = PlayerStats(player_id="plr_123")
+
+        # Act
+        response = lambda_handler(event, lambda_context)
+
+        # Assert
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert body["player_id"] == "plr_123"
+        mock_service.get_player_stats.assert_called_once_with("plr_123")
+
+    @patch("services.player_account_api.src.handler._SERVICE")
+    def test_player_id_taken_from_path_without_path_parameters(
+        self, mock_service: MagicMock, lambda_context: MagicMock
+    ) -> None:
+        """Test direct invokes resolve player_id from the raw path."""
+        # Arrange
+        event = {
+            "httpMethod": "DELETE",
+            "path": "/players/plr_123",
+            "headers": {},
+            "body": None,
+            "pathParameters": None,
+        }
+
+        # Act
+        response = lambda_handler(event, lambda_context)
+
+        # Assert
+        assert response["statusCode"] == 204
+        mock_service.delete_player.assert_called_once_with("plr_123")
+
     def test_invalid_endpoint(self, lambda_context: MagicMock) -> None:
         """Test request to invalid endpoint."""
         # Arrange
@@ -117,8 +184,11 @@ class TestPlayerAccountHandler:
 
         # Assert
         assert response["statusCode"] == 404
+        body = json.loads(response["body"])
+        assert body["error"] == "NOT_FOUND"
+        assert body["message"] == "Endpoint not found: POST /invalid/path"
 
-    @patch("services.player_account_api.src.handler.PlayerAccountService")
+    @patch("services.player_account_api.src.handler._SERVICE")
     def test_update_player_success(
         self, mock_service: MagicMock, lambda_context: MagicMock
     ) -> None:
@@ -138,7 +208,7 @@ class TestPlayerAccountHandler:
             email="test@example.com",
             display_name="Updated Name",
         )
-        mock_service.return_value.update_player.return_value = mock_player
+        mock_service.update_player.return_value = mock_player
 
         # Act
         response = lambda_handler(event, lambda_context)
@@ -148,7 +218,7 @@ class TestPlayerAccountHandler:
         body = json.loads(response["body"])
         assert body["display_name"] == "Updated Name"
 
-    @patch("services.player_account_api.src.handler.PlayerAccountService")
+    @patch("services.player_account_api.src.handler._SERVICE")
     def test_delete_player_success(
         self, mock_service: MagicMock, lambda_context: MagicMock
     ) -> None:
@@ -162,7 +232,7 @@ class TestPlayerAccountHandler:
             "pathParameters": {"player_id": "plr_123"},
         }
 
-        mock_service.return_value.delete_player.return_value = None
+        mock_service.delete_player.return_value = None
 
         # Act
         response = lambda_handler(event, lambda_context)
@@ -170,7 +240,7 @@ class TestPlayerAccountHandler:
         # Assert
         assert response["statusCode"] == 204
 
-    @patch("services.player_account_api.src.handler.PlayerAccountService")
+    @patch("services.player_account_api.src.handler._SERVICE")
     def test_list_players_success(
         self, mock_service: MagicMock, lambda_context: MagicMock
     ) -> None:
@@ -198,7 +268,7 @@ class TestPlayerAccountHandler:
                 display_name="Player 2",
             ),
         ]
-        mock_service.return_value.list_players.return_value = mock_players
+        mock_service.list_players.return_value = mock_players
 
         # Act
         response = lambda_handler(event, lambda_context)
@@ -208,3 +278,25 @@ class TestPlayerAccountHandler:
         body = json.loads(response["body"])
         assert body["count"] == 2
         assert len(body["players"]) == 2
+
+
+class TestHandleGetPlayer:
+    """Test cases for handle_get_player function."""
+
+    def test_uses_injected_service(self) -> None:
+        """Test an explicitly passed service is used instead of the shared one."""
+        # Arrange
+        service = MagicMock()
+        service.get_player.return_value = PlayerAccount(
+            player_id="plr_123",
+            username="testplayer",
+            email="test@example.com",
+            display_name="Test Player",
+        )
+
+        # Act
+        response = handle_get_player("plr_123", service=service)
+
+        # Assert
+        assert response["statusCode"] == 200
+        service.get_player.assert_called_once_with("plr_123")
@@ -4,18 +4,30 @@ import pytest
 from libs.common.src.exceptions import ConflictException, NotFoundException
 
 from services.player_account_api.src.models import (
+    PlayerAccount,
     PlayerStatus,
     UpdatePlayerRequest,
 )
 from services.player_account_api.src.service import PlayerAccountService
 
 
+@pytest.fixture(scope="class")
+def player_service() -> PlayerAccountService:
+    """Create one service instance shared by a test class."""
+    return PlayerAccountService()
+
+
 class TestPlayerAccountService:
     """Test cases for PlayerAccountService class."""
 
-    def setup_method(self) -> None:
-        """Reset storage before each test."""
-        self.service = PlayerAccountService(reset_storage=True)
+    @pytest.fixture(autouse=True)
+    def _reset_service(self, player_service: PlayerAccountService) -> None:
+        """Clear the shared service's storage before each test."""
+        player_service._players.clear()
+        player_service._stats.clear()
+        player_service._by_username.clear()
+        player_service._by_email.clear()
+        self.service = player_service
 
     def test_create_player_success(self) -> None:
         """Test successful player creation."""
@@ -31,24 +43,39 @@ class TestPlayerAccountService:
         assert player.status == PlayerStatus.ACTIVE
         assert player.player_id.startswith("plr_")
 
-    def test_create_player_duplicate_username(self) -> None:
-        """Test creating player with duplicate username."""
+    def test_player_round_trips_through_json(self) -> None:
+        """Test a stored player can be parsed back from its own JSON output."""
         # Arrange
-        self.service.create_player(username="testplayer", email="test1@example.com")
+        player = self.service.create_player(
+            username="testplayer", email="test@example.com"
+        )
 
-        # Act & Assert
-        with pytest.raises(ConflictException) as exc_info:
-            self.service.create_player(username="testplayer", email="test2@example.com")
-        assert "already exists" in str(exc_info.value)
+        # Act
+        from_json = PlayerAccount.model_validate_json(player.model_dump_json())
+        from_dict = PlayerAccount.model_validate(player.model_dump())
 
-    def test_create_player_duplicate_email(self) -> None:
-        """Test creating player with duplicate email."""
+        # Assert
+        assert from_json.model_dump() == player.model_dump()
+        assert from_dict.model_dump() == player.model_dump()
+
+    @pytest.mark.parametrize(
+        ("second_username", "second_email"),
+        [
+            ("testplayer", "test2@example.com"),
+            ("player2", "test1@example.com"),
+        ],
+        ids=["duplicate_username", "duplicate_email"],
+    )
+    def test_create_player_duplicate(
+        self, second_username: str, second_email: str
+    ) -> None:
+        """Test creating player with duplicate username or email."""
         # Arrange
-        self.service.create_player(username="player1", email="test@example.com")
+        self.service.create_player(username="testplayer", email="test1@example.com")
 
         # Act & Assert
         with pytest.raises(ConflictException) as exc_info:
-            self.service.create_player(username="player2", email="test@example.com")
+            self.service.create_player(username=second_username, email=second_email)
         assert "already exists" in str(exc_info.value)
 
     def test_get_player_success(self) -> None:
@@ -65,14 +92,6 @@ class TestPlayerAccountService:
         assert retrieved_player.player_id == created_player.player_id
         assert retrieved_player.username == "testplayer"
 
-    def test_get_player_not_found(self) -> None:
-        """Test getting non-existent player."""
-        # Arrange
-        # Act & Assert
-        with pytest.raises(NotFoundException) as exc_info:
-            self.service.get_player("plr_nonexistent")
-        assert "not found" in str(exc_info.value)
-
     def test_update_player_success(self) -> None:
         """Test successful player update."""
         # Arrange
@@ -90,6 +109,8 @@ class TestPlayerAccountService:
         # Assert
         assert updated_player.display_name == "Updated Name"
         assert updated_player.status == PlayerStatus.SUSPENDED
+        assert self.service.get_player(player.player_id) == updated_player
+        assert player.display_name == "testplayer"
 
     def test_update_player_email_conflict(self) -> None:
         """Test updating player with conflicting email."""
@@ -104,6 +125,39 @@ class TestPlayerAccountService:
             self.service.update_player(player1.player_id, update_request)
         assert "already exists" in str(exc_info.value)
 
+    def test_update_player_same_email(self) -> None:
+        """Test updating a player with its current email is a no-op for email."""
+        # Arrange
+        player = self.service.create_player(
+            username="testplayer", email="test@example.com"
+        )
+
+        # Act
+        updated_player = self.service.update_player(
+            player.player_id, UpdatePlayerRequest(email="test@example.com")
+        )
+
+        # Assert
+        assert updated_player.email == "test@example.com"
+        with pytest.raises(ConflictException):
+            self.service.create_player(username="other", email="test@example.com")
+
+    def test_update_player_email_frees_old_email(self) -> None:
+        """Test the previous email can be reused after an email change."""
+        # Arrange
+        player = self.service.create_player(username="player1", email="old@example.com")
+        self.service.update_player(
+            player.player_id, UpdatePlayerRequest(email="new@example.com")
+        )
+
+        # Act
+        other = self.service.create_player(username="player2", email="old@example.com")
+
+        # Assert
+        assert other.email == "old@example.com"
+        with pytest.raises(ConflictException):
+            self.service.create_player(username="player3", email="new@example.com")
+
     def test_delete_player_success(self) -> None:
         """Test successful player deletion."""
         # Arrange
@@ -118,12 +172,21 @@ class TestPlayerAccountService:
         with pytest.raises(NotFoundException):
             self.service.get_player(player.player_id)
 
-    def test_delete_player_not_found(self) -> None:
-        """Test deleting non-existent player."""
+    def test_delete_player_frees_username_and_email(self) -> None:
+        """Test a deleted player's username and email can be reused."""
         # Arrange
-        # Act & Assert
-        with pytest.raises(NotFoundException):
-            self.service.delete_player("plr_nonexistent")
+        player = self.service.create_player(
+            username="testplayer", email="test@example.com"
+        )
+        self.service.delete_player(player.player_id)
+
+        # Act
+        recreated = self.service.create_player(
+            username="testplayer", email="test@example.com"
+        )
+
+        # Assert
+        assert recreated.player_id != player.player_id
 
     def test_list_players(self) -> None:
         """Test listing all players."""
@@ -155,9 +218,12 @@ class TestPlayerAccountService:
         assert stats.total_games == 0
         assert stats.wins == 0
 
-    def test_get_player_stats_not_found(self) -> None:
-        """Test getting stats for non-existent player."""
-        # Arrange
+    @pytest.mark.parametrize(
+        "method", ["get_player", "delete_player", "get_player_stats"]
+    )
+    def test_player_not_found(self, method: str) -> None:
+        """Test operations on a non-existent player."""
         # Act & Assert
-        with pytest.raises(NotFoundException):
-            self.service.get_player_stats("plr_nonexistent")
+        with pytest.raises(NotFoundException) as exc_info:
+            getattr(self.service, method)("plr_nonexistent")
+        assert "not found" in str(exc_info.value)
@@ -1,44 +1,73 @@
 """Pytest configuration and fixtures for E2E tests."""
 
 import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 
 import pytest
 
+# Read-only so tests cannot leak changes to each other
+_CREDS: Mapping[str, str] = MappingProxyType(
+    {"username": "testuser", "password": "password123"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class E2ESettings:
+    """E2E settings read from the environment."""
+
+    base_url: str | None
+    region: str
+
 
 @pytest.fixture(scope="session")
-def e2e_api_base_url() -> str:
+def e2e_settings() -> E2ESettings:
+    """
+    Load E2E settings from the environment once per session.
+
+    Returns:
+        E2ESettings: E2E test settings
+    """
+    return E2ESettings(
+        base_url=os.getenv("E2E_API_BASE_URL"),
+        region=os.getenv("E2E_AWS_REGION", "us-east-1"),
+    )
+
+
+@pytest.fixture(scope="session")
+def e2e_api_base_url(e2e_settings: E2ESettings) -> str:
     """
     Get the base URL for E2E tests.
 
     Returns:
         str: API Gateway base URL
     """
-    url = os.getenv("E2E_API_BASE_URL")
-    if not url:
+    if not e2e_settings.base_url:
         pytest.skip("E2E_API_BASE_URL environment variable not set")
-    return url
+    return e2e_settings.base_url
 
 
 @pytest.fixture(scope="session")
-def e2e_aws_region() -> str:
+def e2e_aws_region(e2e_settings: E2ESettings) -> str:
     """
     Get AWS region for E2E tests.
 
     Returns:
         str: AWS region
     """
-    return os.getenv("E2E_AWS_REGION", "us-east-1")
+    return e2e_settings.region
 
 
-@pytest.fixture
-def test_user_credentials() -> dict[str, str]:
+@pytest.fixture(scope="session")
+def test_user_credentials() -> Mapping[str, str]:
     """
     Get test user credentials.
 
     Returns:
-        dict: Test user credentials
+        Mapping: Read-only test user credentials
     """
-    return {"username": "testuser", "password": "password123"}
+    return _CREDS
 
 
 @pytest.fixture